@@ -4166,13 +4166,13 @@ class ConfigService:
         ]
 
         # 常见模型名称前缀（用于识别不带厂商前缀的模型）
-        model_prefixes = {
-            "gpt-": "openai",           # gpt-3.5-turbo, gpt-4, gpt-4o
-            "o1-": "openai",            # o1-preview, o1-mini
-            "claude-": "anthropic",     # claude-3-opus, claude-3-sonnet
-            "gemini-": "google",        # gemini-pro, gemini-1.5-pro
-            "gemini": "google",         # gemini (不带连字符)
-        }
+        # 使用元组，str.startswith 一次调用即可匹配全部前缀
+        model_prefixes = (
+            "gpt-",         # OpenAI: gpt-3.5-turbo, gpt-4, gpt-4o
+            "o1-",          # OpenAI: o1-preview, o1-mini
+            "claude-",      # Anthropic: claude-3-opus, claude-3-sonnet
+            "gemini",       # Google: gemini, gemini-pro, gemini-1.5-pro
+        )
 
         # 排除的关键词
         exclude_keywords = [
@@ -4189,6 +4189,9 @@ class ConfigService:
             "instruct",  # 排除 instruct 版本
         ]
 
+        # 排除关键词合并为一个正则，每个模型只需扫描一次
+        exclude_pattern = re.compile("|".join(map(re.escape, exclude_keywords)))
+
         # 日期格式正则表达式（匹配 2024-05-13 这种格式）
         date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}')
 
@@ -4202,12 +4205,9 @@ class ConfigService:
             is_popular_provider = any(provider in model_id for provider in popular_providers)
 
             # 方式2：模型ID以常见前缀开头（如 gpt-4, claude-3-sonnet）
-            if not is_popular_provider:
-                for prefix, provider in model_prefixes.items():
-                    if model_id.startswith(prefix):
-                        is_popular_provider = True
-                        print(f"🔍 识别模型前缀: {model_id} -> {provider}")
-                        break
+            if not is_popular_provider and model_id.startswith(model_prefixes):
+                is_popular_provider = True
+                print(f"🔍 识别模型前缀: {model_id}")
 
             if not is_popular_provider:
                 continue
@@ -4218,7 +4218,7 @@ class ConfigService:
                 continue
 
             # 检查是否包含排除关键词
-            has_exclude_keyword = any(keyword in model_id or keyword in model_name for keyword in exclude_keywords)
+            has_exclude_keyword = bool(exclude_pattern.search(model_id) or exclude_pattern.search(model_name))
 
             if has_exclude_keyword:
                 print(f"⏭️ 跳过排除关键词: {model_id}")
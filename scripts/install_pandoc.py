@@ -6,6 +6,7 @@ Pandoc安装脚本
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
 from pathlib import Path
@@ -65,9 +66,7 @@ def install_pandoc_windows():
     
     # 尝试使用Chocolatey
     try:
-        result = subprocess.run(['choco', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('choco'):
             logger.info(f"🔄 使用Chocolatey安装pandoc...")
             result = subprocess.run(['choco', 'install', 'pandoc', '-y'], 
                                   capture_output=True, text=True, timeout=300)
@@ -76,14 +75,14 @@ def install_pandoc_windows():
                 return True
             else:
                 logger.error(f"❌ Chocolatey安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ Chocolatey未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ Chocolatey未安装")
     
     # 尝试使用winget
     try:
-        result = subprocess.run(['winget', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('winget'):
             logger.info(f"🔄 使用winget安装pandoc...")
             result = subprocess.run(['winget', 'install', 'JohnMacFarlane.Pandoc'], 
                                   capture_output=True, text=True, timeout=300)
@@ -92,6 +91,8 @@ def install_pandoc_windows():
                 return True
             else:
                 logger.error(f"❌ winget安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ winget未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ winget未安装")
     
@@ -104,9 +105,7 @@ def install_pandoc_macos():
     
     # 尝试使用Homebrew
     try:
-        result = subprocess.run(['brew', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('brew'):
             logger.info(f"🔄 使用Homebrew安装pandoc...")
             result = subprocess.run(['brew', 'install', 'pandoc'], 
                                   capture_output=True, text=True, timeout=300)
@@ -115,6 +114,8 @@ def install_pandoc_macos():
                 return True
             else:
                 logger.error(f"❌ Homebrew安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ Homebrew未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ Homebrew未安装")
     
@@ -127,9 +128,7 @@ def install_pandoc_linux():
     
     # 尝试使用apt (Ubuntu/Debian)
     try:
-        result = subprocess.run(['apt', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('apt'):
             logger.info(f"🔄 使用apt安装pandoc...")
             result = subprocess.run(['sudo', 'apt-get', 'update'], 
                                   capture_output=True, text=True, timeout=120)
@@ -145,9 +144,7 @@ def install_pandoc_linux():
     
     # 尝试使用yum (CentOS/RHEL)
     try:
-        result = subprocess.run(['yum', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('yum'):
             logger.info(f"🔄 使用yum安装pandoc...")
             result = subprocess.run(['sudo', 'yum', 'install', '-y', 'pandoc'], 
                                   capture_output=True, text=True, timeout=300)
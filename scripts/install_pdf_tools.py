@@ -6,6 +6,7 @@ PDF工具安装脚本
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
 from pathlib import Path
@@ -49,9 +50,7 @@ def install_wkhtmltopdf_windows():
     """在Windows上安装wkhtmltopdf"""
     # 尝试使用Chocolatey
     try:
-        result = subprocess.run(['choco', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('choco'):
             logger.info(f"🔄 使用Chocolatey安装wkhtmltopdf...")
             result = subprocess.run(['choco', 'install', 'wkhtmltopdf', '-y'], 
                                   capture_output=True, text=True, timeout=300)
@@ -60,14 +59,14 @@ def install_wkhtmltopdf_windows():
                 return True
             else:
                 logger.error(f"❌ Chocolatey安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ Chocolatey未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ Chocolatey未安装")
     
     # 尝试使用winget
     try:
-        result = subprocess.run(['winget', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('winget'):
             logger.info(f"🔄 使用winget安装wkhtmltopdf...")
             result = subprocess.run(['winget', 'install', 'wkhtmltopdf.wkhtmltopdf'], 
                                   capture_output=True, text=True, timeout=300)
@@ -76,6 +75,8 @@ def install_wkhtmltopdf_windows():
                 return True
             else:
                 logger.error(f"❌ winget安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ winget未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ winget未安装")
     
@@ -86,9 +87,7 @@ def install_wkhtmltopdf_windows():
 def install_wkhtmltopdf_macos():
     """在macOS上安装wkhtmltopdf"""
     try:
-        result = subprocess.run(['brew', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('brew'):
             logger.info(f"🔄 使用Homebrew安装wkhtmltopdf...")
             result = subprocess.run(['brew', 'install', 'wkhtmltopdf'], 
                                   capture_output=True, text=True, timeout=300)
@@ -97,6 +96,8 @@ def install_wkhtmltopdf_macos():
                 return True
             else:
                 logger.error(f"❌ Homebrew安装失败: {result.stderr}")
+        else:
+            logger.warning(f"⚠️ Homebrew未安装")
     except (subprocess.TimeoutExpired, FileNotFoundError):
         logger.warning(f"⚠️ Homebrew未安装")
     
@@ -107,9 +108,7 @@ def install_wkhtmltopdf_linux():
     """在Linux上安装wkhtmltopdf"""
     # 尝试使用apt
     try:
-        result = subprocess.run(['apt', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('apt'):
             logger.info(f"🔄 使用apt安装wkhtmltopdf...")
             subprocess.run(['sudo', 'apt-get', 'update'], 
                           capture_output=True, text=True, timeout=120)
@@ -125,9 +124,7 @@ def install_wkhtmltopdf_linux():
     
     # 尝试使用yum
     try:
-        result = subprocess.run(['yum', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
+        if shutil.which('yum'):
             logger.info(f"🔄 使用yum安装wkhtmltopdf...")
             result = subprocess.run(['sudo', 'yum', 'install', '-y', 'wkhtmltopdf'], 
                                   capture_output=True, text=True, timeout=300)
@@ -5,6 +5,7 @@ Docker环境快速配置脚本
 """
 
 import os
+import re
 import shutil
 from pathlib import Path
 
@@ -12,6 +13,22 @@ from pathlib import Path
 from tradingagents.utils.logging_manager import get_logger
 logger = get_logger('scripts')
 
+# Docker环境配置
+DOCKER_ENV_CONFIGS = {
+    'MONGODB_ENABLED': 'true',
+    'REDIS_ENABLED': 'true',
+    'MONGODB_HOST': 'mongodb',
+    'REDIS_HOST': 'redis',
+    'MONGODB_PORT': '27017',
+    'REDIS_PORT': '6379'
+}
+
+# 所有配置项合并为一个预编译正则，一次扫描完成全部替换
+_DOCKER_ENV_RE = re.compile(
+    r'^(' + '|'.join(map(re.escape, DOCKER_ENV_CONFIGS)) + r')=.*$',
+    re.MULTILINE
+)
+
 def setup_docker_env():
     """配置Docker环境"""
     project_root = Path(__file__).parent.parent
@@ -45,29 +62,19 @@ def setup_docker_env():
     with open(env_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # Docker环境配置
-    docker_configs = {
-        'MONGODB_ENABLED': 'true',
-        'REDIS_ENABLED': 'true',
-        'MONGODB_HOST': 'mongodb',
-        'REDIS_HOST': 'redis',
-        'MONGODB_PORT': '27017',
-        'REDIS_PORT': '6379'
-    }
-    
     logger.info(f"\n🔧 配置Docker环境变量...")
-    for key, value in docker_configs.items():
-        # 替换配置值
-        import re
-        pattern = f'^{key}=.*$'
-        replacement = f'{key}={value}'
-        content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-    
-    # 写回文件
-    with open(env_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    logger.info(f"✅ Docker环境配置完成")
+    # 替换配置值
+    new_content = _DOCKER_ENV_RE.sub(
+        lambda m: f"{m.group(1)}={DOCKER_ENV_CONFIGS[m.group(1)]}", content
+    )
+    
+    # 写回文件（模板已是Docker配置时跳过写入）
+    if new_content != content:
+        with open(env_file, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        logger.info(f"✅ Docker环境配置完成")
+    else:
+        logger.info(f"✅ .env已是Docker配置，无需修改")
     
     # API密钥配置提醒
     logger.info(f"\n🔑 API密钥配置")
@@ -102,8 +109,9 @@ def check_docker():
     # 检查Docker是否运行
     try:
         import subprocess
-        result = subprocess.run(['docker', 'info'], 
-                              capture_output=True, text=True, timeout=10)
+        # 只关心返回码，输出直接丢弃，无需捕获和解码
+        result = subprocess.run(['docker', 'info'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         if result.returncode != 0:
             logger.error(f"❌ Docker未运行，请启动Docker Desktop")
             return False
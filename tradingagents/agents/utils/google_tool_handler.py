@@ -60,7 +60,8 @@ class GoogleToolCallHandler:
         
         logger.info(f"[{analyst_name}] ✅ 确认为Google模型")
         logger.debug(f"[{analyst_name}] 🔍 结果类型: {type(result).__name__}")
-        logger.debug(f"[{analyst_name}] 🔍 结果属性: {[attr for attr in dir(result) if not attr.startswith('_')]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{analyst_name}] 🔍 结果属性: {[attr for attr in dir(result) if not attr.startswith('_')]}")
         
         # 检查API调用是否成功
         if not hasattr(result, 'content'):
@@ -71,7 +72,8 @@ class GoogleToolCallHandler:
         # 检查是否有工具调用
         if not hasattr(result, 'tool_calls'):
             logger.warning(f"[{analyst_name}] ⚠️ 结果对象没有tool_calls属性")
-            logger.debug(f"[{analyst_name}] 🔍 可用属性: {[attr for attr in dir(result) if not attr.startswith('_')]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{analyst_name}] 🔍 可用属性: {[attr for attr in dir(result) if not attr.startswith('_')]}")
             return result.content, [result]
         
         if not result.tool_calls:
@@ -293,7 +295,8 @@ class GoogleToolCallHandler:
                 # 详细检查返回结果
                 logger.debug(f"[{analyst_name}] 🔍 检查LLM返回结果...")
                 logger.debug(f"[{analyst_name}] 🔍 返回结果类型: {type(final_result)}")
-                logger.debug(f"[{analyst_name}] 🔍 返回结果属性: {dir(final_result)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[{analyst_name}] 🔍 返回结果属性: {dir(final_result)}")
                 
                 if hasattr(final_result, 'content'):
                     content = final_result.content
@@ -316,7 +319,8 @@ class GoogleToolCallHandler:
                         logger.debug(f"[{analyst_name}] 🔍 空内容详情: repr={repr(content)}")
                 else:
                     logger.warning(f"[{analyst_name}] ⚠️ Google模型返回结果没有content属性")
-                    logger.debug(f"[{analyst_name}] 🔍 可用属性: {[attr for attr in dir(final_result) if not attr.startswith('_')]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[{analyst_name}] 🔍 可用属性: {[attr for attr in dir(final_result) if not attr.startswith('_')]}")
                 
                 # 如果到这里，说明内容为空或没有content属性
                 logger.warning(f"[{analyst_name}] ⚠️ Google模型最终分析报告生成失败 - 内容为空")
@@ -522,14 +526,15 @@ class GoogleToolCallHandler:
                 logger.debug(f"🔍 [{analyst_name}] LLM模型: {getattr(llm, 'model', 'unknown')}")
                 logger.debug(f"🔍 [{analyst_name}] 消息数量: {len(messages)}")
                 
-                # 记录消息类型和长度
-                for i, msg in enumerate(messages):
-                    msg_type = type(msg).__name__
-                    if hasattr(msg, 'content'):
-                        content_length = len(str(msg.content)) if msg.content else 0
-                        logger.debug(f"🔍 [{analyst_name}] 消息{i+1}: {msg_type}, 长度: {content_length}")
-                    else:
-                        logger.debug(f"🔍 [{analyst_name}] 消息{i+1}: {msg_type}, 无content属性")
+                # 记录消息类型和长度（str(content) 对长消息开销较大，仅在DEBUG级别启用时计算）
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, msg in enumerate(messages):
+                        msg_type = type(msg).__name__
+                        if hasattr(msg, 'content'):
+                            content_length = len(str(msg.content)) if msg.content else 0
+                            logger.debug(f"🔍 [{analyst_name}] 消息{i+1}: {msg_type}, 长度: {content_length}")
+                        else:
+                            logger.debug(f"🔍 [{analyst_name}] 消息{i+1}: {msg_type}, 无content属性")
                 
                 # 构建分析提示 - 根据尝试次数调整
                 if attempt == 0:
@@ -571,7 +576,8 @@ class GoogleToolCallHandler:
                 
                 # 详细检查返回结果
                 logger.debug(f"🔍 [{analyst_name}] 返回结果类型: {type(result).__name__}")
-                logger.debug(f"🔍 [{analyst_name}] 返回结果属性: {dir(result)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔍 [{analyst_name}] 返回结果属性: {dir(result)}")
                 
                 if hasattr(result, 'content'):
                     content = result.content
@@ -9,8 +9,7 @@ import time
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tradingagents.llm_adapters import ChatDashScopeOpenAI, ChatGoogleOpenAI
+from tradingagents.llm_adapters import ChatDashScopeOpenAI
 
 from langgraph.prebuilt import ToolNode
 
@@ -66,6 +65,9 @@ def create_llm_by_provider(provider: str, model: str, backend_url: str, temperat
         if not google_api_key:
             raise ValueError("使用Google需要设置GOOGLE_API_KEY环境变量或在数据库中配置API Key")
 
+        # Google 适配器依赖 langchain_google_genai，仅在使用时导入
+        from tradingagents.llm_adapters import ChatGoogleOpenAI
+
         # 传递 base_url 参数，使厂家配置的 default_base_url 生效
         return ChatGoogleOpenAI(
             model=model,
@@ -407,6 +409,8 @@ class TradingAgentsGraph:
             else:
                 logger.info(f"🔧 [Google AI] 未配置 backend_url，使用默认端点")
 
+            from tradingagents.llm_adapters import ChatGoogleOpenAI
+
             self.deep_thinking_llm = ChatGoogleOpenAI(
                 model=self.config["deep_think_llm"],
                 google_api_key=google_api_key,
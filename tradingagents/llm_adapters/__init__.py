@@ -1,5 +1,23 @@
 # LLM Adapters for TradingAgents
-from .dashscope_openai_adapter import ChatDashScopeOpenAI
-from .google_openai_adapter import ChatGoogleOpenAI
+import importlib
+
+# 适配器按需加载（PEP 562），避免导入本包时就拉起 langchain_google_genai 等重型依赖
+_LAZY_ADAPTERS = {
+    "ChatDashScopeOpenAI": "dashscope_openai_adapter",
+    "ChatGoogleOpenAI": "google_openai_adapter",
+}
 
 __all__ = ["ChatDashScopeOpenAI", "ChatGoogleOpenAI"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = adapter
+    return adapter
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,8 +5,8 @@ DeepSeek LLM适配器，支持Token使用统计
 import os
 import time
 from typing import Any, Dict, List, Optional, Union
-from langchain_core.messages import BaseMessage, AIMessage, HumanMessage, SystemMessage
-from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
+from langchain_core.outputs import ChatResult
 from langchain_openai import ChatOpenAI
 from langchain_core.callbacks import CallbackManagerForLLMRun
 
@@ -14,8 +14,7 @@ from langchain_core.callbacks import CallbackManagerForLLMRun
 from tradingagents.utils.logging_init import setup_llm_logging
 
 # 导入日志模块
-from tradingagents.utils.logging_manager import get_logger, get_logger_manager
-logger = get_logger('agents')
+from tradingagents.utils.logging_manager import get_logger_manager
 logger = setup_llm_logging()
 
 # 导入token跟踪器
@@ -141,7 +140,7 @@ class ChatDeepSeek(ChatOpenAI):
             if input_tokens == 0 and output_tokens == 0:
                 input_tokens = self._estimate_input_tokens(messages)
                 output_tokens = self._estimate_output_tokens(result)
-                logger.debug(f"🔍 [DeepSeek] 使用估算token: 输入={input_tokens}, 输出={output_tokens}")
+                logger.debug("🔍 [DeepSeek] 使用估算token: 输入=%s, 输出=%s", input_tokens, output_tokens)
             else:
                 logger.info(f"📊 [DeepSeek] 实际token使用: 输入={input_tokens}, 输出={output_tokens}")
             
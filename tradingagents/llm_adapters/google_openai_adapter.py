@@ -5,18 +5,23 @@ Google AI OpenAI兼容适配器
 """
 
 import os
-from typing import Any, Dict, List, Optional, Union, Sequence
+import re
+from typing import Any, Dict, List, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.tools import BaseTool
-from langchain_core.messages import BaseMessage, AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, AIMessage
 from langchain_core.outputs import LLMResult
-from pydantic import Field, SecretStr
 from ..config.config_manager import token_tracker
 
 # 导入日志模块
 from tradingagents.utils.logging_manager import get_logger
 logger = get_logger('agents')
 
+# 新闻相关关键词，预编译为单个正则，一次扫描完成匹配
+_NEWS_INDICATOR_RE = re.compile("|".join([
+    "股票", "公司", "市场", "投资", "财经", "证券", "交易",
+    "涨跌", "业绩", "财报", "分析", "预测", "消息", "公告"
+]))
+
 
 class ChatGoogleOpenAI(ChatGoogleGenerativeAI):
     """
@@ -215,20 +220,19 @@ class ChatGoogleOpenAI(ChatGoogleGenerativeAI):
             optimized_content = self._enhance_news_content(content)
             message.content = optimized_content
             
-            logger.debug(f"🔧 [Google适配器] 优化新闻内容格式")
-            logger.debug(f"   原始长度: {len(content)} 字符")
-            logger.debug(f"   优化后长度: {len(optimized_content)} 字符")
+            logger.debug("🔧 [Google适配器] 优化新闻内容格式")
+            logger.debug("   原始长度: %d 字符", len(content))
+            logger.debug("   优化后长度: %d 字符", len(optimized_content))
     
     def _is_news_content(self, content: str) -> bool:
         """判断内容是否为新闻内容"""
         
-        # 检查是否包含新闻相关的关键词
-        news_indicators = [
-            "股票", "公司", "市场", "投资", "财经", "证券", "交易",
-            "涨跌", "业绩", "财报", "分析", "预测", "消息", "公告"
-        ]
-        
-        return any(indicator in content for indicator in news_indicators) and len(content) > 200
+        # 先做长度判断，再检查是否包含新闻相关的关键词
+        return (
+            isinstance(content, str)
+            and len(content) > 200
+            and _NEWS_INDICATOR_RE.search(content) is not None
+        )
     
     def _enhance_news_content(self, content: str) -> str:
         """增强新闻内容，添加必要的格式化信息"""
@@ -284,7 +288,7 @@ class ChatGoogleOpenAI(ChatGoogleGenerativeAI):
                         analysis_type=analysis_type
                     )
                     
-                    logger.debug(f"📊 [Google适配器] Token使用量: 输入={input_tokens}, 输出={output_tokens}")
+                    logger.debug("📊 [Google适配器] Token使用量: 输入=%s, 输出=%s", input_tokens, output_tokens)
                     
         except Exception as track_error:
             # token 追踪失败不应该影响主要功能
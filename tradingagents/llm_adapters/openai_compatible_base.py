@@ -5,7 +5,7 @@ OpenAI兼容适配器基类
 
 import os
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional
 from langchain_core.messages import BaseMessage
 from langchain_core.outputs import ChatResult
 from langchain_openai import ChatOpenAI
@@ -13,10 +13,6 @@ from langchain_core.callbacks import CallbackManagerForLLMRun
 
 # 导入统一日志系统
 from tradingagents.utils.logging_init import setup_llm_logging
-
-# 导入日志模块
-from tradingagents.utils.logging_manager import get_logger, get_logger_manager
-logger = get_logger('agents')
 logger = setup_llm_logging()
 
 # 导入token跟踪器
@@ -111,29 +107,18 @@ class OpenAICompatibleBase(ChatOpenAI):
         else:
             logger.info(f"✅ [{provider_name}初始化] 使用传入的 API Key（来自数据库配置），长度: {len(api_key)}")
         
-        # 设置OpenAI兼容参数
-        # 注意：model参数会被Pydantic映射到model_name字段
+        # 设置OpenAI兼容参数，一次构建完成
+        # 注意：model参数会被Pydantic映射到model_name字段；
+        # api_key/base_url 在 ChatOpenAI 中是 openai_api_key/openai_api_base 的别名
         openai_kwargs = {
             "model": model,  # 这会被映射到model_name字段
             "temperature": temperature,
             "max_tokens": max_tokens,
-            **kwargs
+            **kwargs,
+            "api_key": api_key,
+            "base_url": base_url,
         }
         
-        # 根据LangChain版本使用不同的参数名
-        try:
-            # 新版本LangChain
-            openai_kwargs.update({
-                "api_key": api_key,
-                "base_url": base_url
-            })
-        except:
-            # 旧版本LangChain
-            openai_kwargs.update({
-                "openai_api_key": api_key,
-                "openai_api_base": base_url
-            })
-        
         # 初始化父类
         super().__init__(**openai_kwargs)
 